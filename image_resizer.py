@@ -9,28 +9,79 @@ import os
 import sys
 from PIL import Image
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
+import mmap
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
 
-# Configure logging
+# Configure logging - quiet by default; --verbose re-enables INFO
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.WARNING,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Pillow-SIMD reports versions like "9.0.0.post1"; detect it so batch runs
+# can confirm whether the AVX2-vectorized resampling backend is active
+PILLOW_SIMD = 'post' in getattr(Image, '__version__', '')
+
+# jpegli's cjpegli encoder writes ~15-20% smaller JPEGs than libjpeg-turbo
+# at matched perceptual quality; it is used automatically when on PATH
+CJPEGLI = shutil.which('cjpegli')
+
+# Numba JIT-compiles the per-image size arithmetic to native code and
+# caches the artifact on disk, so the compile cost is paid once across
+# runs; the tool works unchanged without numba installed
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _compute_new_size(orig_width, orig_height, target_width, target_height,
+                      keep_aspect):
+    """Fit (orig_width, orig_height) inside the target box, or return the
+    target box itself when the aspect ratio isn't preserved"""
+    if not keep_aspect:
+        return target_width, target_height
+    scale = min(target_width / orig_width, target_height / orig_height)
+    # Round half-up rather than truncate: float error on the binding
+    # axis (e.g. 1171 * (600/1171) = 599.999...) would otherwise land
+    # one pixel short of the target
+    return (max(1, int(orig_width * scale + 0.5)),
+            max(1, int(orig_height * scale + 0.5)))
+
 class ImageResizer:
     """
     A class to handle batch image resizing and format conversion
     """
     
     SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
-    
-    def __init__(self, input_folder, output_folder=None, target_size=None, 
-                 maintain_aspect_ratio=True, output_format=None, quality=85):
+
+    # Same set without the leading dot, for matching raw directory-entry
+    # names without building a Path per file
+    _EXT_SET = {suffix[1:] for suffix in SUPPORTED_FORMATS}
+
+    RESAMPLE_FILTERS = {
+        'lanczos': Image.Resampling.LANCZOS,
+        'bicubic': Image.Resampling.BICUBIC,
+        'hamming': Image.Resampling.HAMMING,
+        'box': Image.Resampling.BOX,
+    }
+
+    def __init__(self, input_folder, output_folder=None, target_size=None,
+                 maintain_aspect_ratio=True, output_format=None, quality=85,
+                 resample_filter='lanczos', fast_encode=False, device='cpu'):
         """
         Initialize the Image Resizer
-        
+
         Args:
             input_folder (str): Path to folder containing images
             output_folder (str): Path to output folder (default: creates 'resized' subfolder)
@@ -38,6 +89,10 @@ class ImageResizer:
             maintain_aspect_ratio (bool): Whether to maintain aspect ratio
             output_format (str): Output format (jpg, png, etc.)
             quality (int): JPEG quality (1-100, default 85)
+            resample_filter (str): Resampling filter (lanczos, bicubic, hamming, box)
+            fast_encode (bool): Trade larger JPEG files for faster encoding
+            device (str): Where the resize runs ('cpu' or 'cuda';
+                          cuda requires torch + torchvision)
         """
         self.input_folder = Path(input_folder)
         self.output_folder = Path(output_folder) if output_folder else self.input_folder / 'resized'
@@ -45,6 +100,38 @@ class ImageResizer:
         self.maintain_aspect_ratio = maintain_aspect_ratio
         self.output_format = output_format.lower() if output_format else None
         self.quality = quality
+        self.resample = self.RESAMPLE_FILTERS[resample_filter]
+        self.device = device
+
+        # Hoisted out of the per-image hot path: these depend only on
+        # constructor arguments, so compute them once instead of doing
+        # string upper/lower work and membership tests per image
+        self._jpeg_output = self.output_format in ('jpg', 'jpeg')
+
+        # JPEG encoder settings: optimize's second Huffman pass roughly
+        # doubles encode cost but shrinks files, and progressive scans use
+        # libjpeg-turbo's SIMD path; --fast-encode drops both for
+        # throughput at the price of larger outputs
+        self._jpeg_kwargs = {
+            'quality': quality,
+            'optimize': not fast_encode,
+            'progressive': not fast_encode,
+        }
+
+        # Per-format dispatch table, built once: maps each normalized
+        # output format to (is_jpeg, ready-to-use save kwargs). This drops
+        # the per-image string normalization and membership tests, and
+        # maps suffixes to Pillow's registered format names, which don't
+        # always match ('jpg' saves as 'JPEG')
+        self._format_info = {}
+        for suffix in self.SUPPORTED_FORMATS:
+            fmt = suffix[1:]
+            is_jpeg = fmt in ('jpg', 'jpeg')
+            pil_format = 'JPEG' if is_jpeg else fmt.upper()
+            save_kwargs = {'format': pil_format}
+            if is_jpeg:
+                save_kwargs.update(self._jpeg_kwargs)
+            self._format_info[fmt] = (is_jpeg, save_kwargs)
         
         # Statistics
         self.processed = 0
@@ -58,12 +145,20 @@ class ImageResizer:
         
     def get_image_files(self):
         """Get all supported image files from input folder"""
+        # os.scandir answers is_file() from the readdir data with no extra
+        # stat call, and filtered-out entries never become Path objects -
+        # noticeably cheaper than iterdir() on folders with many entries
         image_files = []
-        
-        for file_path in self.input_folder.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                image_files.append(file_path)
-                
+        with os.scandir(self.input_folder) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                # Require a real suffix: a file literally named 'jpg' or a
+                # dotfile like '.jpg' has none and must not match
+                stem, sep, ext = entry.name.rpartition('.')
+                if sep and stem and ext.lower() in self._EXT_SET:
+                    image_files.append(Path(entry.path))
+
         logger.info(f"Found {len(image_files)} image(s) to process")
         return image_files
     
@@ -77,90 +172,415 @@ class ImageResizer:
         Returns:
             tuple: New size (width, height)
         """
-        if not self.maintain_aspect_ratio:
-            return self.target_size
-        
-        orig_width, orig_height = original_size
-        target_width, target_height = self.target_size
-        
-        # Calculate aspect ratios
-        orig_ratio = orig_width / orig_height
-        
-        # Calculate new dimensions maintaining aspect ratio
-        if orig_width > orig_height:
-            new_width = target_width
-            new_height = int(target_width / orig_ratio)
-        else:
-            new_height = target_height
-            new_width = int(target_height * orig_ratio)
-            
-        # Ensure dimensions don't exceed target
-        if new_height > target_height:
-            new_height = target_height
-            new_width = int(target_height * orig_ratio)
-        if new_width > target_width:
-            new_width = target_width
-            new_height = int(target_width / orig_ratio)
-            
-        return (new_width, new_height)
+        return _compute_new_size(original_size[0], original_size[1],
+                                 self.target_size[0], self.target_size[1],
+                                 self.maintain_aspect_ratio)
     
+    def _copy_if_unchanged(self, image_path):
+        """
+        Copy the input unchanged when no resize or conversion is needed
+
+        Peeks at the header only - Pillow reads the size without decoding
+        any pixels. When the image already has its final dimensions and
+        keeps its format, a byte-for-byte copy replaces the whole
+        decode/resize/encode pipeline.
+
+        Args:
+            image_path (Path): Path to the image file
+
+        Returns:
+            bool: True if the file was copied to the output folder
+        """
+        with Image.open(image_path) as peek:
+            src_size = peek.size
+        if (self.calculate_new_size(src_size) != src_size
+                or self.output_format not in (None, image_path.suffix[1:].lower())):
+            return False
+
+        # Copy via a temp name and rename into place, matching the
+        # atomic-write behavior of the save stage
+        output_path = self.output_folder / image_path.name
+        tmp = tempfile.NamedTemporaryFile(
+            dir=self.output_folder, suffix=image_path.suffix, delete=False)
+        tmp.close()
+        try:
+            shutil.copyfile(image_path, tmp.name)
+            os.chmod(tmp.name, 0o644)
+            os.replace(tmp.name, output_path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  ✓ %s: already %dx%d, copied unchanged",
+                        image_path.name, src_size[0], src_size[1])
+        return True
+
+    def _load_image(self, image_path):
+        """
+        Load stage: read and decode one image (I/O-latency bound)
+
+        Args:
+            image_path (Path): Path to the image file
+
+        Returns:
+            tuple: (PIL.Image with pixels loaded, original file size in bytes)
+        """
+        # Stat the input once up front; the size is only used for the
+        # log line, so this avoids a second syscall per image later
+        orig_bytes = image_path.stat().st_size
+
+        # Advise the kernel that the file is read once, sequentially, and
+        # that its pages can be dropped after decode - batch runs would
+        # otherwise churn the page cache with data that is never reread
+        fh = open(image_path, 'rb')
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            # Map the file instead of read()ing it: the decoder then pulls
+            # bytes straight out of the kernel page cache with no copies
+            # into userspace buffers, which matters on multi-MB TIFF/PNG
+            # inputs. mmap objects support read/seek, so Pillow treats the
+            # mapping as an ordinary file.
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                img = Image.open(mm)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Processing: %s (%dx%d)",
+                                image_path.name, img.size[0], img.size[1])
+
+                # For JPEG inputs, let libjpeg downscale in the DCT domain
+                # (factors of 1/2, 1/4, 1/8) before the full decode. Aiming
+                # for ~2x the target keeps plenty of detail for the final
+                # resampling pass while skipping most of the decode work.
+                # draft() mutates img.size, so the exact output size is
+                # calculated from the post-draft dimensions later.
+                if image_path.suffix.lower() in ('.jpg', '.jpeg'):
+                    draft_size = (self.target_size[0] * 2, self.target_size[1] * 2)
+                    img.draft('RGB', draft_size)
+
+                img.load()
+            finally:
+                mm.close()
+
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            fh.close()
+
+        return img, orig_bytes
+
+    def _transform_image(self, img):
+        """
+        Transform stage: prefilter, resize and flatten (CPU bound)
+
+        Args:
+            img (PIL.Image): Decoded source image
+
+        Returns:
+            tuple: (resized PIL.Image, new size as (width, height))
+        """
+        # JPEG output can't store alpha; convert to RGBA here but
+        # flatten onto white only *after* resizing, so the composite
+        # touches the small target buffer instead of the
+        # full-resolution source
+        needs_flatten = self._jpeg_output and img.mode in ('RGBA', 'LA', 'P')
+        if needs_flatten:
+            img = img.convert('RGBA')
+
+        # Calculate new size
+        new_size = self.calculate_new_size(img.size)
+
+        # For heavy downscales, shrink with reduce() first - a
+        # SIMD-optimized integer box average that also acts as an
+        # antialiasing prefilter - so the final convolution runs on a
+        # much smaller buffer. Halving the integer ratio keeps a >=2x
+        # margin of work for the chosen filter, and the factor isn't
+        # limited to powers of two. reduce() doesn't support palette or
+        # 1-bit modes, so those go straight to the final resize.
+        if img.mode not in ('P', '1'):
+            factor = min(img.size[0] // new_size[0], img.size[1] // new_size[1]) // 2
+            if factor >= 2:
+                img = img.reduce(factor)
+
+        # Resize the image using the configured resampling filter
+        resized_img = img.resize(new_size, self.resample)
+
+        # Flatten transparency onto a white background at target size
+        if needs_flatten:
+            background = Image.new('RGBA', new_size, (255, 255, 255, 255))
+            background.alpha_composite(resized_img)
+            resized_img = background.convert('RGB')
+
+        return resized_img, new_size
+
+    def _save_image(self, resized_img, image_path, new_size, orig_bytes):
+        """
+        Save stage: encode and write the output file (I/O bound)
+
+        Args:
+            resized_img (PIL.Image): Resized image ready to encode
+            image_path (Path): Path to the original input file
+            new_size (tuple): Output dimensions (width, height)
+            orig_bytes (int): Original file size in bytes, for the log line
+        """
+        # Determine output filename and format; the dispatch table holds
+        # everything format-dependent, precomputed in __init__
+        output_format = self.output_format or image_path.suffix[1:].lower()
+        is_jpeg, save_kwargs = self._format_info[output_format]
+        output_filename = image_path.stem + '.' + output_format
+        output_path = self.output_folder / output_filename
+
+        # Save the resized image; JPEGs go through cjpegli when available
+        # for smaller files at the same quality setting
+        saved = False
+        if is_jpeg and CJPEGLI:
+            try:
+                self._encode_with_jpegli(resized_img, output_path)
+                saved = True
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"cjpegli failed for {image_path.name} ({e}); "
+                               f"falling back to Pillow encoder")
+
+        if not saved:
+            # Write to a temp file and rename into place so readers never
+            # see a half-written output, then drop the written pages from
+            # the page cache - they are not reread by the batch
+            tmp = tempfile.NamedTemporaryFile(
+                dir=self.output_folder, suffix=output_path.suffix, delete=False)
+            try:
+                with tmp:
+                    resized_img.save(tmp, **save_kwargs)
+                    tmp.flush()
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(tmp.fileno(), 0, 0,
+                                         os.POSIX_FADV_DONTNEED)
+                os.chmod(tmp.name, 0o644)
+                os.replace(tmp.name, output_path)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+
+        # Log the result as a single record - one format+flush on
+        # the log stream per image instead of three - and only stat
+        # the output when the line will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  ✓ %s: %dx%d, %.1fKB → %.1fKB → %s",
+                        image_path.name, new_size[0], new_size[1],
+                        orig_bytes / 1024,
+                        output_path.stat().st_size / 1024,
+                        output_path.name)
+
+    def _process_batch_cuda(self, image_files):
+        """
+        Process images with the resize stage running on a CUDA device
+
+        Each image is decoded on the CPU, staged through pinned host
+        memory so the upload overlaps GPU compute, resized with
+        torchvision's antialiased resize, and copied back for CPU-side
+        encoding. Images are handled one at a time because source and
+        target sizes vary per file; uniform-size inputs would stack
+        into larger batches the same way.
+
+        Args:
+            image_files (list): Image paths to process
+
+        Returns:
+            bool: True once the batch has run, False if the CUDA backend
+                  is unavailable (the caller then falls back to the CPU)
+        """
+        try:
+            import torch
+            from torchvision.transforms import functional as TF
+        except ImportError:
+            logger.warning("torch/torchvision not installed; --device cuda unavailable")
+            return False
+        if not torch.cuda.is_available():
+            logger.warning("No CUDA device detected; falling back to CPU")
+            return False
+
+        for image_path in image_files:
+            try:
+                if self._copy_if_unchanged(image_path):
+                    self.processed += 1
+                    continue
+
+                img, orig_bytes = self._load_image(image_path)
+                try:
+                    needs_flatten = (self._jpeg_output
+                                     and img.mode in ('RGBA', 'LA', 'P'))
+                    if needs_flatten:
+                        img = img.convert('RGBA')
+                    elif img.mode not in ('RGB', 'L', 'RGBA', 'LA'):
+                        # RGBA/LA survive the tensor round-trip, so alpha is
+                        # preserved like on the CPU path; only palette and
+                        # CMYK-style modes need promoting, keeping
+                        # transparency when they carry it
+                        img = img.convert(
+                            'RGBA' if 'transparency' in img.info else 'RGB')
+
+                    new_size = self.calculate_new_size(img.size)
+                    tensor = TF.pil_to_tensor(img).pin_memory()
+                    tensor = tensor.to('cuda', non_blocking=True)
+                    resized = TF.resize(tensor, [new_size[1], new_size[0]],
+                                        antialias=True)
+                    resized_img = TF.to_pil_image(resized.cpu())
+                finally:
+                    img.close()
+
+                # Flatten transparency onto white at target size, as in
+                # the CPU transform stage
+                if needs_flatten:
+                    background = Image.new('RGBA', new_size, (255, 255, 255, 255))
+                    background.alpha_composite(resized_img)
+                    resized_img = background.convert('RGB')
+
+                self._save_image(resized_img, image_path, new_size, orig_bytes)
+                self.processed += 1
+            except Exception as e:
+                logger.error(f"  ✗ Failed to process {image_path.name}: {str(e)}")
+                self.failed += 1
+
+        return True
+
+    def _process_pipelined(self, image_files):
+        """
+        Process images through a 3-stage load/resize/save thread pipeline
+
+        Pillow releases the GIL inside its C code, so even on one core the
+        decode of the next image overlaps the resize of the current one and
+        the encode of the previous one. Bounded queues provide backpressure
+        so only a few decoded images are in memory at once.
+
+        Args:
+            image_files (list): Image paths to process
+        """
+        load_queue = queue.Queue(maxsize=4)
+        save_queue = queue.Queue(maxsize=4)
+        done = object()    # end-of-stream sentinel
+        copied = object()  # item satisfied by the copy shortcut
+
+        # Failed and copied items are forwarded down the pipeline as
+        # markers so that all counter updates happen in the saver thread
+        def loader():
+            for image_path in image_files:
+                try:
+                    if self._copy_if_unchanged(image_path):
+                        load_queue.put((image_path, copied, None))
+                        continue
+                    img, orig_bytes = self._load_image(image_path)
+                except Exception as e:
+                    logger.error(f"  ✗ Failed to process {image_path.name}: {str(e)}")
+                    load_queue.put((image_path, None, None))
+                    continue
+                load_queue.put((image_path, img, orig_bytes))
+            load_queue.put(done)
+
+        def resizer():
+            while True:
+                item = load_queue.get()
+                if item is done:
+                    save_queue.put(done)
+                    return
+                image_path, img, orig_bytes = item
+                if img is None or img is copied:
+                    save_queue.put((image_path, img, None, None))
+                    continue
+                try:
+                    resized_img, new_size = self._transform_image(img)
+                except Exception as e:
+                    logger.error(f"  ✗ Failed to process {image_path.name}: {str(e)}")
+                    save_queue.put((image_path, None, None, None))
+                    continue
+                finally:
+                    img.close()
+                save_queue.put((image_path, resized_img, new_size, orig_bytes))
+
+        def saver():
+            while True:
+                item = save_queue.get()
+                if item is done:
+                    return
+                image_path, resized_img, new_size, orig_bytes = item
+                if resized_img is copied:
+                    self.processed += 1
+                    continue
+                if resized_img is None:
+                    self.failed += 1
+                    continue
+                try:
+                    self._save_image(resized_img, image_path, new_size, orig_bytes)
+                    self.processed += 1
+                except Exception as e:
+                    logger.error(f"  ✗ Failed to process {image_path.name}: {str(e)}")
+                    self.failed += 1
+
+        threads = [
+            threading.Thread(target=stage, name=f'resizer-{stage.__name__}')
+            for stage in (loader, resizer, saver)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _encode_with_jpegli(self, resized_img, output_path):
+        """
+        Encode a JPEG through the external cjpegli encoder
+
+        The resized image is handed over as a temporary PPM (raw header +
+        pixels, cheap to write at target size) and cjpegli produces the
+        final JPEG.
+
+        Args:
+            resized_img (PIL.Image): Resized image ready to encode
+            output_path (Path): Destination JPEG path
+        """
+        ppm = tempfile.NamedTemporaryFile(
+            dir=self.output_folder, suffix='.ppm', delete=False)
+        # cjpegli also writes to a temp name that is renamed into place,
+        # so readers never observe a half-written output here either
+        out = tempfile.NamedTemporaryFile(
+            dir=self.output_folder, suffix=output_path.suffix, delete=False)
+        out.close()
+        try:
+            with ppm:
+                resized_img.save(ppm, format='PPM')
+            subprocess.run(
+                [CJPEGLI, ppm.name, out.name, '-q', str(self.quality)],
+                check=True, capture_output=True)
+            os.chmod(out.name, 0o644)
+            os.replace(out.name, output_path)
+        except BaseException:
+            os.unlink(out.name)
+            raise
+        finally:
+            os.unlink(ppm.name)
+
     def resize_image(self, image_path):
         """
         Resize a single image
-        
+
         Args:
             image_path (Path): Path to the image file
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Open the image
-            with Image.open(image_path) as img:
-                logger.info(f"Processing: {image_path.name} ({img.size[0]}x{img.size[1]})")
-                
-                # Convert RGBA to RGB if needed for JPEG output
-                if self.output_format in ['jpg', 'jpeg'] and img.mode in ['RGBA', 'LA', 'P']:
-                    # Create a white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                
-                # Calculate new size
-                new_size = self.calculate_new_size(img.size)
-                
-                # Resize the image using high-quality Lanczos resampling
-                resized_img = img.resize(new_size, Image.Resampling.LANCZOS)
-                
-                # Determine output filename and format
-                output_format = self.output_format or image_path.suffix[1:].lower()
-                output_filename = image_path.stem + '.' + output_format
-                output_path = self.output_folder / output_filename
-                
-                # Save the resized image
-                save_kwargs = {'format': output_format.upper()}
-                if output_format in ['jpg', 'jpeg']:
-                    save_kwargs['quality'] = self.quality
-                    save_kwargs['optimize'] = True
-                
-                resized_img.save(output_path, **save_kwargs)
-                
-                # Log the result
-                original_size = os.path.getsize(image_path) / 1024  # KB
-                new_file_size = os.path.getsize(output_path) / 1024  # KB
-                
-                logger.info(f"  ✓ Resized to {new_size[0]}x{new_size[1]}")
-                logger.info(f"  ✓ Size: {original_size:.1f}KB → {new_file_size:.1f}KB")
-                logger.info(f"  ✓ Saved as: {output_path.name}")
-                
-                self.processed += 1
+            if self._copy_if_unchanged(image_path):
                 return True
-                
+
+            img, orig_bytes = self._load_image(image_path)
+            try:
+                resized_img, new_size = self._transform_image(img)
+            finally:
+                img.close()
+            self._save_image(resized_img, image_path, new_size, orig_bytes)
+            return True
+
         except Exception as e:
             logger.error(f"  ✗ Failed to process {image_path.name}: {str(e)}")
-            self.failed += 1
             return False
     
     def process_batch(self):
@@ -168,6 +588,7 @@ class ImageResizer:
         logger.info("=" * 50)
         logger.info("Starting batch image resize process")
         logger.info(f"Input folder: {self.input_folder}")
+        logger.info(f"Pillow backend: {'Pillow-SIMD' if PILLOW_SIMD else 'stock Pillow'}")
         logger.info(f"Target size: {self.target_size[0]}x{self.target_size[1]}")
         logger.info(f"Maintain aspect ratio: {self.maintain_aspect_ratio}")
         if self.output_format:
@@ -184,10 +605,32 @@ class ImageResizer:
             logger.warning("No supported image files found in the input folder")
             return
         
-        # Process each image
-        for i, image_path in enumerate(image_files, 1):
-            logger.info(f"\n[{i}/{len(image_files)}] Processing image...")
-            self.resize_image(image_path)
+        # Resize on the GPU when requested; falls through to the CPU
+        # paths below if torch/torchvision or a CUDA device is missing
+        if self.device == 'cuda' and self._process_batch_cuda(image_files):
+            self.print_summary()
+            return
+
+        # Process images in parallel - each image is independent, so one
+        # worker process per core gives near-linear throughput scaling.
+        # On a single core a pool buys nothing, so overlap the I/O-bound
+        # load/save stages with the CPU-bound resize instead.
+        max_workers = os.cpu_count() or 1
+        if max_workers == 1:
+            self._process_pipelined(image_files)
+        else:
+            # Workers inherit the logging level via fork; on spawn
+            # platforms (Windows/macOS) they re-import the module and log
+            # at the default WARNING, so per-image INFO lines from
+            # --verbose only appear in the parent there
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(self.resize_image, image_files, chunksize=4)
+                for i, success in enumerate(results, 1):
+                    logger.info(f"[{i}/{len(image_files)}] image processed")
+                    if success:
+                        self.processed += 1
+                    else:
+                        self.failed += 1
         
         # Print summary
         self.print_summary()
@@ -246,6 +689,14 @@ Examples:
         help='Convert images to specified format'
     )
     
+    parser.add_argument(
+        '--filter',
+        dest='resample_filter',
+        choices=['lanczos', 'bicubic', 'hamming', 'box'],
+        default='lanczos',
+        help='Resampling filter (default: lanczos; bicubic/hamming trade a little quality for speed)'
+    )
+
     parser.add_argument(
         '--quality', '-q',
         type=int,
@@ -255,6 +706,25 @@ Examples:
         help='JPEG quality (1-100, default: 85)'
     )
     
+    parser.add_argument(
+        '--device',
+        choices=['cpu', 'cuda'],
+        default='cpu',
+        help='Run the resize on the CPU or a CUDA GPU (cuda requires torch + torchvision)'
+    )
+
+    parser.add_argument(
+        '--fast-encode',
+        action='store_true',
+        help='Skip Huffman optimization and progressive encoding for faster JPEG writes (larger files)'
+    )
+
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Enable INFO logging (progress and summary; default shows only warnings/errors)'
+    )
+
     parser.add_argument(
         '--no-aspect-ratio',
         action='store_false',
@@ -263,7 +733,10 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.INFO)
+
     # Validate input folder
     if not os.path.exists(args.input_folder):
         logger.error(f"Error: Input folder '{args.input_folder}' does not exist")
@@ -280,7 +753,10 @@ Examples:
         target_size=tuple(args.size),
         maintain_aspect_ratio=args.maintain_aspect_ratio,
         output_format=args.output_format,
-        quality=args.quality
+        quality=args.quality,
+        resample_filter=args.resample_filter,
+        fast_encode=args.fast_encode,
+        device=args.device
     )
     
     # Process images